@@ -2,19 +2,38 @@ import os
 import logging
 import json
 import base64
+import queue
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
+import orjson
 import requests
-from requests.auth import HTTPDigestAuth
-import os.path
+from requests.adapters import HTTPAdapter
+from cachetools import LRUCache, TTLCache
 from flask import Flask, request, jsonify
+from flask.json.provider import JSONProvider
+from werkzeug.exceptions import RequestEntityTooLarge
 from google.oauth2 import service_account
-from googleapiclient.discovery import build
-from googleapiclient.http import MediaFileUpload
-from notion_client import Client
+from googleapiclient.discovery import build_from_document
+from googleapiclient.discovery_cache import get_static_doc
+from googleapiclient.http import MediaIoBaseUpload, build_http
 from dotenv import load_dotenv
 from google.auth.transport.requests import Request
+from google_auth_httplib2 import AuthorizedHttp
+
+# JSON de requisições/respostas do Flask via orjson
+class OrjsonProvider(JSONProvider):
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj).decode('utf-8')
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
 
 # Setup
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
 load_dotenv()
 
 # Logging
@@ -44,107 +63,210 @@ NOTION_DB_OBRAS = os.getenv("NOTION_DB_OBRAS")
 DRIVE_FOLDER_ID = os.getenv("GOOGLE_DRIVE_FOLDER_ID")
 KOBO_TOKEN = os.getenv("KOBO_TOKEN")
 KOBO_MEDIA_TOKEN = os.getenv("KOBO_MEDIA_TOKEN", KOBO_TOKEN)
+# O JSON do Kobo traz apenas metadados dos attachments; limita o corpo aceito
+app.config["MAX_CONTENT_LENGTH"] = int(os.getenv("MAX_CONTENT_LENGTH", 2 * 1024 * 1024))
+
+# URLs da API do Notion
+NOTION_API_URL = "https://api.notion.com/v1"
+NOTION_PAGES_URL = f"{NOTION_API_URL}/pages"
+NOTION_QUERY_URL = {
+    db: f"{NOTION_API_URL}/databases/{db}/query"
+    for db in (NOTION_DB_APONTAMENTOS, NOTION_DB_USUARIOS, NOTION_DB_OBRAS)
+}
 
 # Initialize clients
-notion = Client(auth=NOTION_TOKEN)
 creds = service_account.Credentials.from_service_account_info(
     GOOGLE_CREDENTIALS, scopes=['https://www.googleapis.com/auth/drive']
 )
 if not creds.valid:
     creds.refresh(Request())
-drive_service = build('drive', 'v3', credentials=creds)
+
+# Documento de discovery empacotado no google-api-python-client: lido uma vez,
+# sem requisição HTTPS na inicialização do worker
+DRIVE_DISCOVERY_DOC = get_static_doc('drive', 'v3')
+
+# httplib2 não é thread-safe: um cliente Drive (e conexão keep-alive) por thread.
+# build_http() mantém o timeout de 60 s e não trata o 308 dos uploads
+# resumable como redirect, como o build() original
+_tls = threading.local()
+
+def get_drive():
+    drive = getattr(_tls, 'drive', None)
+    if drive is None:
+        http = AuthorizedHttp(creds, http=build_http())
+        drive = build_from_document(DRIVE_DISCOVERY_DOC, http=http)
+        _tls.drive = drive
+    return drive
+
+# Pool compartilhado entre requisições, para que cada thread reaproveite seu cliente Drive
+upload_executor = ThreadPoolExecutor(max_workers=8)
+# Busca do usuário em paralelo com a recontagem do título (só quando o
+# contador precisa ser recontado no Notion)
+notion_executor = ThreadPoolExecutor(max_workers=4)
+
+# Sessões HTTP persistentes (keep-alive) para Notion e Kobo
+notion_session = requests.Session()
+notion_session.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=20))
+notion_session.headers.update({
+    "Authorization": f"Bearer {NOTION_TOKEN}",
+    "Content-Type": "application/json",
+    "Notion-Version": "2022-06-28"
+})
+
+kobo_session = requests.Session()
+kobo_session.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=20))
+
+# Cache em memória de obras/usuários (mudam raramente)
+obra_cache = TTLCache(maxsize=1024, ttl=300)
+user_cache = TTLCache(maxsize=4096, ttl=300)
+# Último número de apontamento por obra, como (número, semeado_em). Um
+# TTLCache não serve: cada escrita renova a validade e o contador nunca seria
+# recontado sob tráfego contínuo; a idade vem de semeado_em
+counter_cache = LRUCache(maxsize=1024)
+COUNTER_TTL = 300
+cache_lock = threading.Lock()
 
 # Função custom para query em database
-def query_notion_database(database_id, filter_dict):
-    url = f"https://api.notion.com/v1/databases/{database_id}/query"
-    headers = {
-        "Authorization": f"Bearer {NOTION_TOKEN}",
-        "Content-Type": "application/json",
-        "Notion-Version": "2022-06-28"
-    }
+def query_notion_database(database_id, filter_dict, start_cursor=None, page_size=None, raise_errors=False):
+    url = NOTION_QUERY_URL[database_id]
     payload = {"filter": filter_dict} if filter_dict else {}
-    response = requests.post(url, headers=headers, json=payload)
+    if start_cursor:
+        payload["start_cursor"] = start_cursor
+    if page_size:
+        payload["page_size"] = page_size
+    response = notion_session.post(url, data=orjson.dumps(payload), timeout=10)
     if response.status_code == 200:
-        return response.json()
+        return orjson.loads(response.content)
     else:
         logger.error(f"[NOTION] Query error {response.status_code}: {response.text}")
+        if raise_errors:
+            raise requests.HTTPError(f"Notion query error {response.status_code}", response=response)
         return {"results": []}
 
-def upload_para_drive(filename):
+def notion_create_page(database_id, properties):
+    payload = {"parent": {"database_id": database_id}, "properties": properties}
+    response = notion_session.post(NOTION_PAGES_URL, data=orjson.dumps(payload), timeout=15)
+    if response.status_code != 200:
+        logger.error(f"[NOTION] Create page error {response.status_code}: {response.text}")
+        response.raise_for_status()
+    return orjson.loads(response.content)
+
+def notion_update_page(page_id, properties):
+    payload = {"properties": properties}
+    response = notion_session.patch(f"{NOTION_PAGES_URL}/{page_id}", data=orjson.dumps(payload), timeout=15)
+    if response.status_code != 200:
+        logger.error(f"[NOTION] Update page error {response.status_code}: {response.text}")
+        response.raise_for_status()
+    return orjson.loads(response.content)
+
+# Tamanho máximo mantido em memória por attachment antes de usar disco
+SPOOL_MAX_SIZE = 16 * 1024 * 1024
+# Abaixo deste tamanho um upload multipart único evita a requisição extra que
+# abre a sessão resumable; acima, chunks de 8 MiB limitam o que é reenviado
+# em caso de falha
+RESUMABLE_THRESHOLD = 5 * 1024 * 1024
+RESUMABLE_CHUNK_SIZE = 8 * 1024 * 1024
+
+# Único host para o qual o token Kobo é enviado
+KOBO_HOST = "kf.kobotoolbox.org"
+
+def upload_para_drive(filename, download_url=None):
     logger.info(f"[DRIVE] Iniciando upload para arquivo: {filename}")
     try:
-        # URL direta Kobo para attachment
-        base_url = "https://kf.kobotoolbox.org/attachment/original"
-        download_url = f"{base_url}?media_file={filename}"
+        # download_url vem do corpo do webhook: só é usada se apontar para o
+        # Kobo via https; caso contrário usa a URL direta do attachment
+        url = urlparse(download_url) if download_url else None
+        if not url or url.scheme != "https" or url.hostname != KOBO_HOST:
+            if download_url:
+                logger.warning(f"[DRIVE] download_url fora de {KOBO_HOST} ignorada: {download_url}")
+            base_url = f"https://{KOBO_HOST}/attachment/original"
+            download_url = f"{base_url}?media_file={filename}"
         logger.info(f"[DRIVE] URL construída: {download_url}")
 
-        diretorio = "fotos_recebidas"
-        if not os.path.exists(diretorio):
-            os.makedirs(diretorio)
-        caminho = os.path.join(diretorio, os.path.basename(filename))
-
         # Header correto para Kobo API v2: Token (não Bearer)
         token_to_use = KOBO_MEDIA_TOKEN if KOBO_MEDIA_TOKEN != KOBO_TOKEN else KOBO_TOKEN
         headers = {'Authorization': f'Token {token_to_use}'}
         logger.info(f"[DRIVE] Usando header: Authorization: Token ******")
 
-        response = requests.get(download_url, headers=headers, stream=True, timeout=60)
+        response = kobo_session.get(download_url, headers=headers, stream=True, timeout=60)
         logger.info(f"[DRIVE] Status download: {response.status_code}")
 
         if response.status_code != 200:
             logger.warning(f"[DRIVE] Falha com Token ({response.status_code}): {response.text[:500]}")
             logger.info("[DRIVE] Fallback: tentativa sem header")
-            response = requests.get(download_url, stream=True, timeout=60)
+            response = kobo_session.get(download_url, stream=True, timeout=60)
             logger.info(f"[DRIVE] Status fallback: {response.status_code}")
 
         if response.status_code != 200:
             logger.error(f"[DRIVE] Todas tentativas falharam: {response.status_code} - {response.text[:500]}")
             return None
 
-        with open(caminho, 'wb') as f:
-            for chunk in response.iter_content(chunk_size=8192):
-                f.write(chunk)
-        logger.info(f"[DRIVE] Download sucesso, tamanho: {os.path.getsize(caminho)} bytes")
-
-        media = MediaFileUpload(caminho, resumable=True)
-        arquivo_metadata = {'name': os.path.basename(filename), 'parents': [DRIVE_FOLDER_ID]}
-        arquivo = drive_service.files().create(body=arquivo_metadata, media_body=media, fields='id').execute()
+        # MediaIoBaseUpload precisa de um arquivo com seek: mantém em memória
+        # e só vai para disco acima de SPOOL_MAX_SIZE
+        with tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE) as arquivo_tmp:
+            for chunk in response.iter_content(chunk_size=1024 * 1024):
+                arquivo_tmp.write(chunk)
+            tamanho = arquivo_tmp.tell()
+            logger.info(f"[DRIVE] Download sucesso, tamanho: {tamanho} bytes")
+            arquivo_tmp.seek(0)
+
+            mimetype = response.headers.get('Content-Type', 'application/octet-stream')
+            if tamanho < RESUMABLE_THRESHOLD:
+                media = MediaIoBaseUpload(arquivo_tmp, mimetype=mimetype, resumable=False)
+            else:
+                media = MediaIoBaseUpload(arquivo_tmp, mimetype=mimetype, chunksize=RESUMABLE_CHUNK_SIZE, resumable=True)
+            arquivo_metadata = {'name': os.path.basename(filename), 'parents': [DRIVE_FOLDER_ID]}
+            arquivo = get_drive().files().create(body=arquivo_metadata, media_body=media, fields='id').execute()
         file_id = arquivo.get('id')
         link = f"https://drive.google.com/file/d/{file_id}/view"
         logger.info(f"[DRIVE] Upload sucesso: {link}")
 
-        if os.path.exists(caminho):
-            os.remove(caminho)
-
         return link
     except Exception as e:
         logger.error(f"[DRIVE] Exceção: {str(e)}")
         return None
 
 # Funções Notion
+def title(s):
+    return {"title": [{"text": {"content": s}}]}
+
+def rt(s):
+    return {"rich_text": [{"text": {"content": s or ""}}]}
+
 def obter_usuario_por_login(login):
+    with cache_lock:
+        if login in user_cache:
+            return user_cache[login]
     try:
         response = query_notion_database(NOTION_DB_USUARIOS, {"property": "Título", "title": {"equals": login}})
         resultados = response.get("results", [])
         if resultados:
-            return resultados[0]["id"]
-        new_user = notion.pages.create(
-            parent={"database_id": NOTION_DB_USUARIOS},
-            properties={"Título": {"title": [{"text": {"content": login}}]}}
-        )
-        logger.info(f"[NOTION] Usuário criado: {login}")
-        return new_user["id"]
+            usuario_id = resultados[0]["id"]
+        else:
+            new_user = notion_create_page(NOTION_DB_USUARIOS, {"Título": title(login)})
+            logger.info(f"[NOTION] Usuário criado: {login}")
+            usuario_id = new_user["id"]
+        with cache_lock:
+            user_cache[login] = usuario_id
+        return usuario_id
     except Exception as e:
         logger.error(f"[NOTION] Erro usuário: {e}")
         return None
 
 def obter_obra_id(obra_nome):
+    with cache_lock:
+        if obra_nome in obra_cache:
+            return obra_cache[obra_nome]
     try:
         response = query_notion_database(NOTION_DB_OBRAS, {"property": "Título", "title": {"equals": obra_nome}})
         resultados = response.get("results", [])
         if resultados:
             logger.info(f"[NOTION] Obra encontrada: {obra_nome}")
-            return resultados[0]["id"]
+            obra_id = resultados[0]["id"]
+            # Obra não encontrada (None) não é cacheada
+            with cache_lock:
+                obra_cache[obra_nome] = obra_id
+            return obra_id
         else:
             logger.warning(f"[NOTION] Obra não encontrada: {obra_nome}")
             return None
@@ -152,28 +274,166 @@ def obter_obra_id(obra_nome):
         logger.error(f"[NOTION] Erro obra: {e}")
         return None
 
+def numero_do_titulo(pagina):
+    # Extrai NNN de um título "<obra> - NNN"; None se não estiver nesse formato
+    partes = pagina.get("properties", {}).get("Título", {}).get("title", [])
+    texto = "".join(p.get("plain_text", "") for p in partes)
+    _, _, sufixo = texto.rpartition(" - ")
+    return int(sufixo) if sufixo.isdigit() else None
+
+def ultimo_numero_apontamento(obra_id):
+    # Maior número já usado num título da obra (ou o total de páginas, se for
+    # maior): lacunas na numeração não fazem a recontagem repetir um título.
+    # Notion devolve no máximo 100 resultados por página: percorre todas.
+    # Uma página com erro levanta exceção, para que nenhum total parcial seja cacheado
+    total = 0
+    maior = 0
+    cursor = None
+    while True:
+        response = query_notion_database(
+            NOTION_DB_APONTAMENTOS, {"property": "Obras", "relation": {"contains": obra_id}},
+            start_cursor=cursor, page_size=100, raise_errors=True
+        )
+        resultados = response.get("results", [])
+        total += len(resultados)
+        for pagina in resultados:
+            numero = numero_do_titulo(pagina)
+            if numero is not None and numero > maior:
+                maior = numero
+        cursor = response.get("next_cursor")
+        if not response.get("has_more") or not cursor:
+            return max(total, maior)
+
+def liberar_numero(obra_id, numero):
+    # Devolve o número reservado se a página não foi criada e nenhum outro foi
+    # reservado depois dele; caso contrário fica uma lacuna (sem repetição)
+    with cache_lock:
+        entrada = counter_cache.get(obra_id)
+        if entrada and entrada[0] == numero:
+            counter_cache[obra_id] = (numero - 1, entrada[1])
+
+def contador_precisa_recontar(obra_id):
+    with cache_lock:
+        entrada = counter_cache.get(obra_id)
+        return not entrada or time.monotonic() - entrada[1] >= COUNTER_TTL
+
 def gerar_titulo(obra_nome, obra_id):
+    # Retorna (título, número reservado); o número é reservado sob cache_lock
+    # para que requisições simultâneas da mesma obra não repitam o título
     try:
-        response = query_notion_database(NOTION_DB_APONTAMENTOS, {"property": "Obras", "relation": {"contains": obra_id}})
-        total = len(response.get("results", [])) + 1
-        return f"{obra_nome} - {total:03d}"
+        with cache_lock:
+            entrada = counter_cache.get(obra_id)
+            if entrada and time.monotonic() - entrada[1] < COUNTER_TTL:
+                numero = entrada[0] + 1
+                counter_cache[obra_id] = (numero, entrada[1])
+                return f"{obra_nome} - {numero:03d}", numero
+        # Contador ausente ou semeado há mais de COUNTER_TTL: reconta no Notion
+        ultimo = ultimo_numero_apontamento(obra_id)
+        with cache_lock:
+            # Nunca volta abaixo do que já foi reservado aqui: páginas reservadas
+            # podem ainda não existir no Notion durante a recontagem
+            entrada = counter_cache.get(obra_id)
+            numero = max(ultimo, entrada[0]) + 1 if entrada else ultimo + 1
+            counter_cache[obra_id] = (numero, time.monotonic())
+        return f"{obra_nome} - {numero:03d}", numero
     except Exception as e:
         logger.error(f"[TÍTULO] Erro: {e}")
-        return f"{obra_nome} - 001"
+        return f"{obra_nome} - 001", None
+
+def deduplicar_attachments(attachments):
+    # Reenvios do Kobo podem repetir o mesmo arquivo: usa md5 quando disponível
+    vistos = set()
+    unicos = []
+    for attachment in attachments:
+        filename = attachment.get("filename")
+        if not filename:
+            continue
+        chave = attachment.get("md5") or filename
+        if chave in vistos:
+            logger.info(f"[DRIVE] Attachment duplicado ignorado: {filename}")
+            continue
+        vistos.add(chave)
+        unicos.append(attachment)
+    return unicos
+
+# Uploads rodam fora da requisição: o webhook responde assim que a página é
+# criada e os links são gravados na página quando os uploads terminam
+upload_queue = queue.Queue()
+UPLOAD_CONSUMERS = 4
+# page_ids enfileirados e ainda não concluídos (drenados no encerramento)
+uploads_pendentes = set()
+uploads_lock = threading.Lock()
+
+def enfileirar_uploads(page_id, attachments):
+    with uploads_lock:
+        uploads_pendentes.add(page_id)
+    upload_queue.put((page_id, attachments))
+
+def processar_uploads(page_id, attachments):
+    futures = [
+        upload_executor.submit(upload_para_drive, a["filename"], a.get("download_url"))
+        for a in attachments
+    ]
+    links_fotos = []
+    for future in futures:
+        link = future.result()
+        if link:
+            links_fotos.append(f"Foto: {link}")
+    if not links_fotos:
+        logger.warning(f"[DRIVE] Nenhum upload concluído para a página {page_id}")
+        return
+    fotos = rt("\n".join(links_fotos))
+    notion_update_page(page_id, {"Fotos": fotos, "Docs": fotos})
+    logger.info(f"[NOTION] Fotos adicionadas à página {page_id}: {len(links_fotos)}")
+
+def upload_worker():
+    while True:
+        page_id, attachments = upload_queue.get()
+        try:
+            processar_uploads(page_id, attachments)
+        except Exception:
+            logger.exception(f"[DRIVE] Erro nos uploads da página {page_id}")
+        finally:
+            with uploads_lock:
+                uploads_pendentes.discard(page_id)
+            upload_queue.task_done()
+
+def drenar_uploads(timeout):
+    # Chamado no encerramento do worker (gunicorn.conf.py): aguarda os uploads
+    # pendentes até timeout e registra as páginas que ficarem sem fotos
+    limite = time.monotonic() + timeout
+    while True:
+        with uploads_lock:
+            pendentes = sorted(uploads_pendentes)
+        if not pendentes:
+            logger.info("[DRIVE] Fila de uploads drenada")
+            return
+        if time.monotonic() >= limite:
+            break
+        time.sleep(0.5)
+    for page_id in pendentes:
+        logger.error(f"[DRIVE] Upload descartado no encerramento, página sem fotos: {page_id}")
+
+for i in range(UPLOAD_CONSUMERS):
+    threading.Thread(target=upload_worker, name=f"upload_worker_{i}", daemon=True).start()
 
 @app.route("/webhook_kobo", methods=["POST"])
 def receber_dados():
     try:
-        logger.info(f"[REQUEST] Headers: {dict(request.headers)}")
-        body_text = request.get_data(as_text=True)
-        logger.info(f"[REQUEST] Body parcial: {body_text[:1000]}")
+        # Token no header é validado antes de ler o corpo da requisição
+        auth_header = request.headers.get('Authorization')
+        if auth_header and auth_header.replace('Bearer ', '', 1) != KOBO_TOKEN:
+            return jsonify({"erro": "Token inválido"}), 401
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("[REQUEST] Headers: %s", dict(request.headers))
+            logger.debug("[REQUEST] Body parcial: %s", request.get_data(as_text=True)[:1000])
 
         dados = request.get_json()
         if not dados:
             return jsonify({"erro": "Dados JSON ausentes"}), 400
 
-        auth_header = request.headers.get('Authorization')
-        token = auth_header.replace('Bearer ', '', 1) if auth_header else dados.get('token')
+        token = dados.get('token') if not auth_header else None
         if token and token != KOBO_TOKEN:
             return jsonify({"erro": "Token inválido"}), 401
 
@@ -185,45 +445,50 @@ def receber_dados():
         if not obra_id:
             return jsonify({"erro": "Obra não encontrada"}), 400
 
-        titulo = gerar_titulo(obra, obra_id)
-        usuario_id = obter_usuario_por_login(dados.get("_submitted_by", ""))
-
-        links_fotos = []
         attachments = dados.get("_attachments", [])
         logger.info(f"[DRIVE] Attachments encontrados: {len(attachments)}")
-        for attachment in attachments:
-            filename = attachment.get("filename")
-            if filename:
-                logger.info(f"[DRIVE] Processando filename: {filename}")
-                link = upload_para_drive(filename)
-                if link:
-                    links_fotos.append(f"Foto: {link}")
+        attachments = deduplicar_attachments(attachments)
+
+        login = dados.get("_submitted_by", "")
+        if contador_precisa_recontar(obra_id):
+            # gerar_titulo vai consultar o Notion: busca o usuário em paralelo
+            usuario_future = notion_executor.submit(obter_usuario_por_login, login)
+            titulo, numero = gerar_titulo(obra, obra_id)
+            usuario_id = usuario_future.result()
+        else:
+            titulo, numero = gerar_titulo(obra, obra_id)
+            usuario_id = obter_usuario_por_login(login)
 
         propriedades = {
-            "Título": {"title": [{"text": {"content": titulo}}]},
+            "Título": title(titulo),
             "Obras": {"relation": [{"id": obra_id}]},
-            "Localização": {"rich_text": [{"text": {"content": dados.get("localizacao", "")}}]},
-            "Apontamentos": {"rich_text": [{"text": {"content": dados.get("apontamento", "")}}]},
+            "Localização": rt(dados.get("localizacao")),
+            "Apontamentos": rt(dados.get("apontamento")),
             "Status": {"select": {"name": dados.get("status", "")}},
             "Data de Criação": {"date": {"start": dados.get("_submission_time", "")}},
-            "UUID": {"rich_text": [{"text": {"content": dados.get("_uuid", "")}}]}
+            "UUID": rt(dados.get("_uuid"))
         }
         if usuario_id:
             propriedades["Resp"] = {"relation": [{"id": usuario_id}]}
-        if links_fotos:
-            propriedades["Fotos"] = {"rich_text": [{"text": {"content": "\n".join(links_fotos)}}]}
-            propriedades["Docs"] = {"rich_text": [{"text": {"content": "\n".join(links_fotos)}}]}
 
-        pagina = notion.pages.create(
-            parent={"database_id": NOTION_DB_APONTAMENTOS},
-            properties=propriedades
-        )
+        try:
+            pagina = notion_create_page(NOTION_DB_APONTAMENTOS, propriedades)
+        except Exception:
+            if numero is not None:
+                liberar_numero(obra_id, numero)
+            raise
         logger.info(f"[NOTION] Página criada: {pagina['id']}")
+        if attachments:
+            enfileirar_uploads(pagina['id'], attachments)
         return jsonify({"status": "OK", "notion_page": pagina['id']}), 200
 
+    except RequestEntityTooLarge:
+        logger.warning("[REQUEST] Corpo acima de MAX_CONTENT_LENGTH")
+        return jsonify({"erro": "Payload muito grande"}), 413
     except Exception as e:
         logger.exception("[ERROR] Erro geral")
         return jsonify({"erro": str(e)}), 500
 
 if __name__ == "__main__":
-    app.run(debug=True, host='0.0.0.0', port=10000)
+    # Apenas para desenvolvimento local; em produção use: gunicorn app:app
+    app.run(host='0.0.0.0', port=10000)
@@ -0,0 +1,25 @@
+# Configuração do gunicorn (carregada automaticamente: `gunicorn app:app`)
+import os
+import sys
+
+bind = f"0.0.0.0:{os.getenv('PORT', '10000')}"
+
+# Webhook é limitado por I/O (Notion/Kobo/Drive): threads por worker
+worker_class = "gthread"
+# Um único processo: a numeração dos títulos (counter_cache) e a fila de
+# uploads vivem em memória, e vários processos repetiriam números
+workers = 1
+threads = int(os.getenv("GUNICORN_THREADS", "8"))
+
+# Uploads para o Drive podem demorar
+timeout = 120
+
+# Tempo dado ao worker no encerramento; inclui a drenagem da fila de uploads
+graceful_timeout = 90
+UPLOAD_DRAIN_TIMEOUT = 60
+
+def worker_exit(server, worker):
+    # Uploads pendentes rodam em threads daemon: aguarda antes do processo sair
+    app = sys.modules.get("app")
+    if app is not None:
+        app.drenar_uploads(UPLOAD_DRAIN_TIMEOUT)